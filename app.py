@@ -4,7 +4,9 @@ Flask web application for esxtop batch data analysis.
 Provides a web interface to upload CSV files and run analysis.
 """
 
+import asyncio
 import os
+import re
 import subprocess
 import tempfile
 import shutil
@@ -18,6 +20,10 @@ app.config['UPLOAD_FOLDER'] = '/tmp/esxtop_uploads'
 app.config['OUTPUT_FOLDER'] = '/tmp/esxtop_output'
 
 ALLOWED_EXTENSIONS = {'csv'}
+UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024  # Copy uploads to disk in 4 MiB chunks
+
+# ANSI color/control sequences, matched on raw script output bytes
+_ANSI_RE = re.compile(rb'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
 
 
 def allowed_file(filename):
@@ -30,7 +36,61 @@ def ensure_dirs():
     os.makedirs(app.config['OUTPUT_FOLDER'], exist_ok=True)
 
 
-def run_analysis(csv_path, analysis_type, output_dir):
+def save_stream(stream, dest_path):
+    """Copy an upload stream to disk in large chunks without buffering it in memory."""
+    with open(dest_path, 'wb') as dst:
+        shutil.copyfileobj(stream, dst, length=UPLOAD_CHUNK_SIZE)
+
+
+def advise_file(path, advice):
+    """Pass a posix_fadvise hint for a whole file; no-op where unsupported."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    finally:
+        os.close(fd)
+
+
+async def process_upload(filename, stream, analysis_type):
+    """Save an uploaded CSV stream into a fresh output directory and analyze it."""
+    # Create unique output directory for this analysis
+    output_dir = tempfile.mkdtemp(dir=app.config['OUTPUT_FOLDER'])
+
+    # Save uploaded file
+    filename = secure_filename(filename)
+    csv_path = os.path.join(output_dir, filename)
+    await asyncio.to_thread(save_stream, stream, csv_path)
+
+    # Run analysis
+    results = await run_analysis(csv_path, analysis_type, output_dir)
+
+    # The upload is read once per analysis; drop it from the page cache so
+    # large uploads don't evict other hot pages on a busy server
+    if hasattr(os, 'posix_fadvise'):
+        advise_file(csv_path, os.POSIX_FADV_DONTNEED)
+
+    # Store output_dir in session or return it for file downloads
+    results['output_dir'] = os.path.basename(output_dir)
+    results['filename'] = filename
+
+    return results
+
+
+def list_output_files(output_dir):
+    """Return names of generated result files (charts, data, column id lists)."""
+    with os.scandir(output_dir) as entries:
+        return [
+            entry.name for entry in entries
+            if entry.is_file() and entry.name.endswith(('.png', '.data', '_col_ids'))
+        ]
+
+
+async def run_analysis(csv_path, analysis_type, output_dir):
     """
     Run esxtop analysis script and capture output.
 
@@ -49,47 +109,68 @@ def run_analysis(csv_path, analysis_type, output_dir):
         'errors': []
     }
 
-    # Change to output directory for generated files
-    original_dir = os.getcwd()
-    os.chdir(output_dir)
-
     try:
         scripts_dir = Path(__file__).parent / 'scripts'
 
-        if analysis_type in ('describe', 'both'):
-            # Run describe analysis (non-interactive mode)
-            result = run_describe_script(csv_path, scripts_dir, 'describe_extop_web.sh')
-            results['output'] += f"\n{'='*60}\nVMDK ANALYSIS (Virtual Disk)\n{'='*60}\n"
-            results['output'] += result['output']
-            if not result['success']:
-                results['errors'].append(result.get('error', 'Unknown error in describe'))
-
-        if analysis_type in ('describe-pdisk', 'both'):
-            # Run physical disk analysis
-            result = run_describe_script(csv_path, scripts_dir, 'describe_physical_disk.sh')
-            results['output'] += f"\n{'='*60}\nPHYSICAL DISK ANALYSIS\n{'='*60}\n"
+        # Start the selected scripts back to back so they run concurrently;
+        # they write to distinct files in output_dir
+        jobs = []
+        try:
+            if analysis_type in ('describe', 'both'):
+                # Run describe analysis (non-interactive mode)
+                jobs.append((
+                    'VMDK ANALYSIS (Virtual Disk)', 'describe',
+                    await start_describe_script(
+                        csv_path, scripts_dir, 'describe_extop_web.sh', output_dir
+                    ),
+                ))
+
+            if analysis_type in ('describe-pdisk', 'both'):
+                # Run physical disk analysis
+                jobs.append((
+                    'PHYSICAL DISK ANALYSIS', 'describe-pdisk',
+                    await start_describe_script(
+                        csv_path, scripts_dir, 'describe_physical_disk.sh', output_dir
+                    ),
+                ))
+        except BaseException:
+            # Don't leave an already started script running if a later one
+            # fails to start
+            for _, _, process in jobs:
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass  # already exited
+                await process.wait()
+            raise
+
+        job_results = await asyncio.gather(
+            *(finish_describe_script(process) for _, _, process in jobs)
+        )
+        for (heading, name, _), result in zip(jobs, job_results):
+            results['output'] += f"\n{'='*60}\n{heading}\n{'='*60}\n"
             results['output'] += result['output']
             if not result['success']:
-                results['errors'].append(result.get('error', 'Unknown error in describe-pdisk'))
+                results['errors'].append(result.get('error', f'Unknown error in {name}'))
 
         # Collect generated files
-        for f in os.listdir(output_dir):
-            if f.endswith(('.png', '.data', '_col_ids')):
-                results['files'].append(f)
+        results['files'] = await asyncio.to_thread(list_output_files, output_dir)
 
         results['success'] = len(results['errors']) == 0
 
     except Exception as e:
         results['success'] = False
         results['errors'].append(str(e))
-    finally:
-        os.chdir(original_dir)
 
     return results
 
 
-def run_describe_script(csv_path, scripts_dir, script_name):
-    """Run a describe script and capture output."""
+async def start_describe_script(csv_path, scripts_dir, script_name, output_dir):
+    """Start a describe script without waiting for it and return the process.
+
+    The script runs with output_dir as its working directory, where it
+    writes its generated files.
+    """
     script_path = scripts_dir / script_name
 
     # For the web version, we need a non-interactive script
@@ -99,30 +180,38 @@ def run_describe_script(csv_path, scripts_dir, script_name):
         if not script_path.exists():
             script_path = scripts_dir / 'describe_extop.sh'
 
+    return await asyncio.create_subprocess_exec(
+        'bash', str(script_path), str(csv_path),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        stdin=subprocess.PIPE,
+        cwd=output_dir,
+        env={**os.environ, 'TERM': 'dumb'}  # Disable color codes
+    )
+
+
+async def finish_describe_script(process):
+    """Wait for a script started by start_describe_script and capture output."""
     try:
-        # Run with 'yes' piped to handle any interactive prompts
-        process = subprocess.Popen(
-            ['bash', str(script_path), str(csv_path)],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            stdin=subprocess.PIPE,
-            text=True,
-            env={**os.environ, 'TERM': 'dumb'}  # Disable color codes
+        # Answer 'y' to handle any interactive prompts
+        stdout, stderr = await asyncio.wait_for(
+            process.communicate(b'y\n'), timeout=300  # 5 min timeout
         )
-        stdout, stderr = process.communicate(input='y\n', timeout=300)  # 5 min timeout
 
-        # Strip ANSI color codes
-        import re
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        stdout = ansi_escape.sub('', stdout)
+        # Strip ANSI color codes before decoding so the output is decoded once;
+        # with TERM=dumb there usually are none, and a byte scan is far cheaper
+        if b'\x1b' in stdout:
+            stdout = _ANSI_RE.sub(b'', stdout)
+        stdout = stdout.decode('utf-8', errors='replace')
 
         return {
             'output': stdout,
             'success': process.returncode == 0,
-            'error': stderr if process.returncode != 0 else None
+            'error': stderr.decode('utf-8', errors='replace') if process.returncode != 0 else None
         }
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         process.kill()
+        await process.wait()
         return {
             'output': '',
             'success': False,
@@ -143,7 +232,7 @@ def index():
 
 
 @app.route('/upload', methods=['POST'])
-def upload_file():
+async def upload_file():
     """Handle CSV file upload and run analysis."""
     ensure_dirs()
 
@@ -159,22 +248,31 @@ def upload_file():
 
     analysis_type = request.form.get('analysis_type', 'both')
 
-    # Create unique output directory for this analysis
-    output_dir = tempfile.mkdtemp(dir=app.config['OUTPUT_FOLDER'])
+    return jsonify(await process_upload(file.filename, file.stream, analysis_type))
 
-    # Save uploaded file
-    filename = secure_filename(file.filename)
-    csv_path = os.path.join(output_dir, filename)
-    file.save(csv_path)
 
-    # Run analysis
-    results = run_analysis(csv_path, analysis_type, output_dir)
+@app.route('/upload/raw', methods=['POST'])
+async def upload_raw():
+    """Handle a raw CSV request body and run analysis.
 
-    # Store output_dir in session or return it for file downloads
-    results['output_dir'] = os.path.basename(output_dir)
-    results['filename'] = filename
+    Skips multipart parsing entirely: the body is streamed straight to disk.
+    Filename and analysis type are passed as query parameters, e.g.:
+
+        curl --data-binary @esxtop.csv \\
+            'http://localhost:5000/upload/raw?filename=esxtop.csv&analysis_type=both'
+    """
+    ensure_dirs()
+
+    filename = request.args.get('filename', '')
+    if filename == '':
+        return jsonify({'error': 'No filename provided'}), 400
+
+    if not allowed_file(filename):
+        return jsonify({'error': 'Only CSV files are allowed'}), 400
+
+    analysis_type = request.args.get('analysis_type', 'both')
 
-    return jsonify(results)
+    return jsonify(await process_upload(filename, request.stream, analysis_type))
 
 
 @app.route('/download/<output_dir>/<filename>')
@@ -1,38 +1,97 @@
 #!/usr/bin/env python3
 
 import csv
-import re
+import io
 import sys
-from collections import OrderedDict
+
+try:
+    import polars as pl
+except ImportError:  # Optional: not a project dependency, csv fallback below
+    pl = None
 
 if len(sys.argv) < 3:
     print("Usage: get_value_by_col_index.py <esxtop-batch.csv> <column_index>")
+    print("Reads the CSV with polars when it is installed (pip install polars),")
+    print("otherwise with the csv module.")
     sys.exit(1)
 
 filename = sys.argv[1]
 column_index = int(sys.argv[2])
 output_file = f"col_{column_index}.data"
 
-timestamp_pattern = re.compile(r'\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}')
-time_series = OrderedDict()
+READ_BUFFER_SIZE = 1 << 22  # 4 MiB; esxtop rows can be hundreds of KiB wide
+TIMESTAMP_REGEX = r'^\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}$'
 
-try:
-    with open(filename, newline='', encoding='utf-8-sig') as csvfile:
+
+def is_timestamp(cell):
+    """Fixed-offset check for MM/DD/YYYY HH:MM:SS, cheaper than a regex."""
+    return (len(cell) == 19 and cell[2] == '/' and cell[5] == '/'
+            and cell[10] == ' ' and cell[13] == ':' and cell[16] == ':')
+
+
+def read_with_polars():
+    """Read only the timestamp and target columns with the polars CSV parser.
+
+    Like the csv fallback, a repeated timestamp keeps its first position
+    and its last value.
+    """
+    df = pl.read_csv(
+        filename,
+        has_header=False,
+        skip_rows=1,
+        columns=sorted({0, column_index}),  # polars rejects duplicate indices
+        infer_schema_length=0,
+        truncate_ragged_lines=True,
+    )
+    ts_col = df.columns[0]
+    df = df.filter(pl.col(ts_col).str.contains(TIMESTAMP_REGEX))
+    if column_index == 0:
+        # The timestamp cell itself is not a number
+        values = [None] * df.height
+    else:
+        values = df[df.columns[1]].cast(pl.Float64, strict=False).to_list()
+    return list(dict(zip(df[ts_col].to_list(), values)).items())
+
+
+def read_with_csv():
+    """Fallback: read every row with csv.reader.
+
+    esxtop always writes the timestamp in column 0, so only that cell is
+    checked instead of matching a regex against every cell of the row.
+    Only the requested cell is kept per row, not the whole row.
+    """
+    seen = {}
+    with open(filename, 'rb', buffering=READ_BUFFER_SIZE) as raw, \
+            io.TextIOWrapper(raw, encoding='utf-8-sig', newline='') as csvfile:
+        csv.field_size_limit(max(csv.field_size_limit(), READ_BUFFER_SIZE))
         reader = csv.reader(csvfile)
         for row in reader:
-            for i, cell in enumerate(row):
-                if timestamp_pattern.fullmatch(cell.strip('"')):
-                    timestamp = cell.strip('"')
-                    time_series[timestamp] = row
-                    break
+            cell = row[0].strip('"') if row else ""
+            if is_timestamp(cell):
+                try:
+                    value = float(row[column_index])
+                except (IndexError, ValueError):
+                    value = None
+                seen[cell] = value
+    return list(seen.items())
+
+
+try:
+    points = None
+    if pl is not None:
+        try:
+            points = read_with_polars()
+        except pl.exceptions.PolarsError:
+            points = None  # e.g. column index out of range; let csv path write NaN
+    if points is None:
+        points = read_with_csv()
 
     # Write to output file
     with open(output_file, 'w') as out:
-        for timestamp, row in time_series.items():
-            try:
-                value = float(row[column_index])
+        for timestamp, value in points:
+            if value is not None:
                 out.write(f"{timestamp}: {value}\n")
-            except (IndexError, ValueError):
+            else:
                 out.write(f"{timestamp}: NaN\n")
 
     print(f"Saved output to: {output_file}")
@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 
 import sys
+from pathlib import Path
+
 import matplotlib.pyplot as plt
-from datetime import datetime
+
+# Add src/ to path so the script runs without installing the package
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from esxtop_visualizer.visualizer import load_data_file  # noqa: E402
 
 if len(sys.argv) < 2:
     print("Usage: plot_chart_from_ext.py <data_values_filterd_by_column_idx.data>")
@@ -10,19 +16,7 @@ if len(sys.argv) < 2:
 
 data_file = sys.argv[1]
 
-timestamps = []
-values = []
-
-with open(data_file, 'r') as f:
-    for line in f:
-        try:
-            ts, val = line.strip().split(": ")
-            dt = datetime.strptime(ts, "%m/%d/%Y %H:%M:%S")
-            val = float(val) * 100
-            timestamps.append(dt)
-            values.append(val)
-        except:
-            continue
+timestamps, values = load_data_file(data_file, 100)
 
 plt.figure(figsize=(12, 6))
 plt.plot(timestamps, values, label='Value × 100', color='blue')
@@ -1,10 +1,17 @@
 #!/usr/bin/env python3
 
 import sys
+import matplotlib
+matplotlib.use('Agg')  # Only saves to PNG; skip GUI backend setup
 import matplotlib.pyplot as plt
-from datetime import datetime
 import os
 import re
+from pathlib import Path
+
+# Add src/ to path so the script runs without installing the package
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from esxtop_visualizer.visualizer import load_data_file  # noqa: E402
 
 if len(sys.argv) < 2:
     print("Usage: plot_chart_from_ext.py <data_values_filtered_by_column_idx.data>")
@@ -12,9 +19,6 @@ if len(sys.argv) < 2:
 
 data_file = sys.argv[1]
 
-timestamps = []
-values = []
-
 # Extract column index from filename
 match = re.search(r'col_(\d+)', data_file)
 if match:
@@ -24,16 +28,7 @@ else:
     print("Error: Could not extract column index from filename.")
     sys.exit(1)
 
-with open(data_file, 'r') as f:
-    for line in f:
-        try:
-            ts, val = line.strip().split(": ")
-            dt = datetime.strptime(ts, "%m/%d/%Y %H:%M:%S")
-            val = float(val) * 1
-            timestamps.append(dt)
-            values.append(val)
-        except ValueError:
-            continue
+timestamps, values = load_data_file(data_file, 1)
 
 plt.figure(figsize=(12, 6))
 plt.plot(timestamps, values, label='Value', color='blue')
@@ -2,14 +2,34 @@
 """
 Unified visualization script for esxtop time series data.
 Replaces plot_chart_form_data_file.py and save_chart_from_column_id.py
+
+Thin shim over esxtop_visualizer.visualizer; loading, titling and plotting
+all live in the package so there is a single copy to maintain.
 """
 
 import argparse
-import re
 import sys
-from datetime import datetime
+from pathlib import Path
+
+# Add src/ to path so the shim runs without installing the package
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from esxtop_visualizer.visualizer import (  # noqa: E402
+    generate_output_filename,
+    generate_title,
+    load_data_file,
+    plot_time_series,
+    visualize,
+)
 
-import matplotlib.pyplot as plt
+__all__ = [
+    "generate_output_filename",
+    "generate_title",
+    "load_data_file",
+    "plot_time_series",
+    "visualize",
+    "main",
+]
 
 
 def parse_args():
@@ -35,81 +55,17 @@ def parse_args():
     return parser.parse_args()
 
 
-def load_data(data_file, scale):
-    """Load and parse time series data from .data file."""
-    timestamps = []
-    values = []
-    skipped = 0
-
-    with open(data_file, 'r') as f:
-        for line in f:
-            try:
-                ts, val = line.strip().split(": ")
-                dt = datetime.strptime(ts, "%m/%d/%Y %H:%M:%S")
-                val = float(val) * scale
-                timestamps.append(dt)
-                values.append(val)
-            except (ValueError, IndexError):
-                skipped += 1
-                continue
-
-    if skipped > 0:
-        print(f"Warning: Skipped {skipped} malformed lines", file=sys.stderr)
-
-    return timestamps, values
-
-
-def get_title(data_file):
-    """Generate chart title from filename."""
-    match = re.search(r'col_(\d+)', data_file)
-    if match:
-        return f"Column {match.group(1)} Data Over Time"
-    return f"Data from {data_file}"
-
-
-def get_default_output(data_file):
-    """Generate default output filename from input filename."""
-    match = re.search(r'col_(\d+)', data_file)
-    if match:
-        return f"esxtop_col_{match.group(1)}.png"
-    return data_file.replace('.data', '.png')
-
-
-def plot_chart(timestamps, values, title, scale, output=None, show=True):
-    """Create and display/save the chart."""
-    if not timestamps:
-        print("Error: No data to plot", file=sys.stderr)
-        sys.exit(1)
-
-    label = f"Value × {scale}" if scale != 1.0 else "Value"
-    ylabel = label
-
-    plt.figure(figsize=(12, 6))
-    plt.plot(timestamps, values, label=label, color='blue')
-    plt.xlabel("Timestamp")
-    plt.ylabel(ylabel)
-    plt.title(title)
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.grid(True)
-    plt.legend()
-
-    if output:
-        plt.savefig(output)
-        print(f"Chart saved as {output}")
-
-    if show:
-        plt.show()
-
-
 def main():
     args = parse_args()
 
-    timestamps, values = load_data(args.data_file, args.scale)
-    title = get_title(args.data_file)
-
-    show = not args.no_show
-    plot_chart(timestamps, values, title, args.scale, args.output, show)
+    try:
+        visualize(args.data_file, args.scale, args.output, not args.no_show)
+    except FileNotFoundError:
+        print(f"Error: File '{args.data_file}' not found.", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
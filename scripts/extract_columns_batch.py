@@ -4,13 +4,14 @@ CLI wrapper for batch extraction of multiple columns.
 Reads the CSV file once and extracts all specified columns efficiently.
 
 Usage:
-    ./scripts/extract_columns_batch.py <csv_file> <col1> <col2> <col3> ...
+    ./scripts/extract_columns_batch.py [--no-titles] <csv_file> <col1> <col2> <col3> ...
 
 Example:
     ./scripts/extract_columns_batch.py esxtop.csv 100 200 300
-    # Creates: col_100.data, col_200.data, col_300.data
+    # Creates: col_100.data, col_200.data, col_300.data (+ .meta title files)
 """
 
+import argparse
 import sys
 from pathlib import Path
 
@@ -23,50 +24,50 @@ from esxtop_visualizer.parser import parse_csv_header
 
 
 def main():
-    if len(sys.argv) < 3:
-        print("Usage: extract_columns_batch.py <csv_file> <col1> <col2> [col3] ...")
-        print()
-        print("Extract multiple columns from CSV in a single pass.")
-        print("Much more efficient than extracting columns individually.")
-        print("Also saves human-friendly titles to .meta files for better charts.")
-        print()
-        print("Example:")
-        print("  ./scripts/extract_columns_batch.py esxtop.csv 100 200 300")
-        sys.exit(1)
-
-    filename = sys.argv[1]
-
-    # Parse column indices
-    try:
-        column_indices = [int(col) for col in sys.argv[2:]]
-    except ValueError:
-        print("Error: Column indices must be integers")
-        sys.exit(1)
-
-    if not column_indices:
-        print("Error: At least one column index must be provided")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Extract multiple columns from CSV in a single pass. "
+                    "Much more efficient than extracting columns individually.",
+        epilog="Example: ./scripts/extract_columns_batch.py esxtop.csv 100 200 300",
+    )
+    parser.add_argument("csv_file", help="esxtop batch mode CSV file")
+    parser.add_argument(
+        "column_indices",
+        nargs="+",
+        type=int,
+        metavar="column_index",
+        help="Column indices to extract"
+    )
+    parser.add_argument(
+        "--no-titles",
+        action="store_true",
+        help="Skip header parsing and don't write human-friendly titles to .meta files"
+    )
+
+    args = parser.parse_args()
+    filename = args.csv_file
+    column_indices = args.column_indices
 
     try:
         print(f"Extracting {len(column_indices)} columns from {filename}...")
 
+        if args.no_titles:
+            output_files = extract_and_save_batch(filename, column_indices)
+            print(f"Successfully extracted {len(output_files)} columns:")
+            for output_file in output_files:
+                print(f"  - {output_file}")
+            return
+
         # Parse CSV header to get friendly names
         print("Reading column metadata...")
         columns = parse_csv_header(filename)
         column_map = {col.index: col for col in columns}
 
-        # Build title mapping
-        column_titles = {}
-        for idx in column_indices:
-            if idx in column_map:
-                column_titles[idx] = column_map[idx].get_friendly_name()
-
-        # Extract with metadata
-        output_files = extract_and_save_batch(filename, column_indices, column_titles=column_titles)
+        # Extract with metadata; titles are derived from the parsed columns
+        output_files = extract_and_save_batch(filename, column_indices, columns=columns)
 
         print(f"Successfully extracted {len(output_files)} columns:")
         for idx, output_file in zip(column_indices, output_files):
-            title = column_titles.get(idx, "Unknown")
+            title = column_map[idx].get_friendly_name() if idx in column_map else "Unknown"
             print(f"  - {output_file} ({title})")
 
     except FileNotFoundError:
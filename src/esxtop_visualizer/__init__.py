@@ -34,6 +34,7 @@ from .extractor import (
     extract_and_save,
     extract_multiple_columns,
     extract_and_save_batch,
+    extract_and_save_streaming,
 )
 
 # Public API exports from visualizer module
@@ -41,6 +42,7 @@ from .visualizer import (
     load_data_file,
     plot_time_series,
     visualize,
+    visualize_many,
     generate_title,
     generate_output_filename,
 )
@@ -60,10 +62,12 @@ __all__ = [
     "extract_and_save",
     "extract_multiple_columns",
     "extract_and_save_batch",
+    "extract_and_save_streaming",
     # Visualizer
     "load_data_file",
     "plot_time_series",
     "visualize",
+    "visualize_many",
     "generate_title",
     "generate_output_filename",
 ]
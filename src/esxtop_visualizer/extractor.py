@@ -6,22 +6,44 @@ in PDH-CSV format esxtop batch exports.
 """
 
 import csv
+import mmap
+import os
 import re
 from collections import OrderedDict
-from typing import Dict, Optional, Iterator, Tuple, List
+from contextlib import ExitStack
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Iterator, Tuple, List
+
+import numpy as np
+
+from .parser import ColumnMetadata
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+except ImportError:  # Optional dependency: fall back to csv.reader
+    pa = None
 
 
 class TimeSeriesData:
     """Represents extracted time series data with timestamp-value pairs.
 
-    Internally uses OrderedDict to maintain temporal sequence.
+    Points are stored as two parallel lists in insertion (temporal) order,
+    which is far cheaper per point than a dict. With dedupe=True, adding a
+    timestamp that is already present overwrites its value in place, as
+    the former OrderedDict storage did.
 
     Attributes:
-        data: Ordered dictionary mapping timestamps to values
+        timestamps: Timestamp strings in insertion order
+        values: Values parallel to timestamps, None for missing data
     """
 
-    def __init__(self):
-        self.data: Dict[str, Optional[float]] = OrderedDict()
+    def __init__(self, dedupe: bool = False):
+        self.timestamps: List[str] = []
+        self.values: List[Optional[float]] = []
+        self._positions: Optional[Dict[str, int]] = {} if dedupe else None
 
     def add_point(self, timestamp: str, value: Optional[float]) -> None:
         """Add a data point to the time series.
@@ -30,29 +52,70 @@ class TimeSeriesData:
             timestamp: Timestamp string in MM/DD/YYYY HH:MM:SS format
             value: Numeric value or None for missing data
         """
-        self.data[timestamp] = value
+        if self._positions is not None:
+            pos = self._positions.get(timestamp)
+            if pos is not None:
+                self.values[pos] = value
+                return
+            self._positions[timestamp] = len(self.timestamps)
+        self.timestamps.append(timestamp)
+        self.values.append(value)
+
+    def add_points(self, timestamps: List[str], values: List[Optional[float]]) -> None:
+        """Add many data points at once.
+
+        Args:
+            timestamps: Timestamp strings in MM/DD/YYYY HH:MM:SS format
+            values: Values parallel to timestamps, None for missing data
+        """
+        if self._positions is not None:
+            for timestamp, value in zip(timestamps, values):
+                self.add_point(timestamp, value)
+            return
+        self.timestamps.extend(timestamps)
+        self.values.extend(values)
+
+    @property
+    def data(self) -> Mapping[str, Optional[float]]:
+        """Read-only mapping of timestamp to value (later duplicates win).
+
+        Built from the point lists on every access, so it is a snapshot;
+        use add_point to change the series.
+        """
+        return MappingProxyType(OrderedDict(zip(self.timestamps, self.values)))
 
     def __len__(self) -> int:
         """Return number of data points."""
-        return len(self.data)
+        return len(self.timestamps)
 
     def __iter__(self) -> Iterator[Tuple[str, Optional[float]]]:
         """Iterate over (timestamp, value) pairs."""
-        return iter(self.data.items())
+        return zip(self.timestamps, self.values)
 
     def __repr__(self) -> str:
         return f"TimeSeriesData({len(self)} points)"
 
 
-# Timestamp pattern: MM/DD/YYYY HH:MM:SS (quoted in CSV)
-TIMESTAMP_PATTERN = re.compile(r'\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}')
+# Timestamp pattern: MM/DD/YYYY HH:MM:SS (quoted in CSV). Anchored at the
+# end so match() suffices; callers check len(cell) == TIMESTAMP_LENGTH first
+# to reject value cells without entering the regex engine.
+_TIMESTAMP_REGEX = r'\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}'
+TIMESTAMP_PATTERN = re.compile(_TIMESTAMP_REGEX + r'\Z')
+TIMESTAMP_LENGTH = 19
+
+# esxtop PDH-CSV exports always have the timestamp in column 0. When True,
+# extraction only checks that column (falling back to scanning every cell
+# if that yields no data points); set to False to always scan every cell.
+STRICT_PDH_LAYOUT = True
 
 
 def extract_column_data(filename: str, column_index: int) -> TimeSeriesData:
     """Extract time series data from a specific CSV column.
 
-    Scans CSV rows looking for timestamp cells, then extracts the corresponding
-    value from the specified column index.
+    Uses the same backends as extract_multiple_columns, so with pyarrow
+    installed only the timestamp and target columns are parsed; otherwise
+    rows are scanned for timestamp cells and the value is read from the
+    specified column index.
 
     Args:
         filename: Path to CSV file
@@ -69,33 +132,14 @@ def extract_column_data(filename: str, column_index: int) -> TimeSeriesData:
         >>> data = extract_column_data("esxtop_batch.csv", 100)
         >>> print(f"Extracted {len(data)} data points")
     """
-    time_series = TimeSeriesData()
+    return extract_multiple_columns(filename, [column_index])[column_index]
 
-    try:
-        with open(filename, newline='', encoding='utf-8-sig') as csvfile:
-            reader = csv.reader(csvfile)
-
-            for row in reader:
-                # Look for timestamp in any column
-                for cell in row:
-                    cell_clean = cell.strip('"')
-                    if TIMESTAMP_PATTERN.fullmatch(cell_clean):
-                        timestamp = cell_clean
 
-                        # Extract value from target column
-                        try:
-                            value = float(row[column_index])
-                            time_series.add_point(timestamp, value)
-                        except (IndexError, ValueError):
-                            time_series.add_point(timestamp, None)
-                        break
+# Lines formatted per write() in save_time_series
+SAVE_BLOCK_LINES = 65536
 
-        return time_series
-
-    except FileNotFoundError:
-        raise FileNotFoundError(f"CSV file '{filename}' not found")
-    except Exception as e:
-        raise ValueError(f"Error extracting data: {e}")
+# Buffer size for sequentially read CSV input and written .data output
+IO_BUFFER_SIZE = 1 << 20
 
 
 def save_time_series(time_series: TimeSeriesData, output_file: str) -> None:
@@ -112,12 +156,17 @@ def save_time_series(time_series: TimeSeriesData, output_file: str) -> None:
         >>> data = extract_column_data("esxtop_batch.csv", 100)
         >>> save_time_series(data, "col_100.data")
     """
-    with open(output_file, 'w') as out:
-        for timestamp, value in time_series:
-            if value is not None:
-                out.write(f"{timestamp}: {value}\n")
-            else:
-                out.write(f"{timestamp}: NaN\n")
+    points = iter(time_series)
+    with open(output_file, 'w', buffering=IO_BUFFER_SIZE) as out:
+        # Format and write in blocks of lines rather than one write per point
+        while True:
+            block = [
+                f"{timestamp}: {'NaN' if value is None else value}\n"
+                for timestamp, value in islice(points, SAVE_BLOCK_LINES)
+            ]
+            if not block:
+                break
+            out.write("".join(block))
 
 
 def save_metadata(column_title: str, output_file: str) -> None:
@@ -133,7 +182,6 @@ def save_metadata(column_title: str, output_file: str) -> None:
         >>> save_metadata("VM:scsi0:2 - Average Write Latency", "col_100.data")
         # Creates col_100.meta with the title
     """
-    import os
     base = os.path.splitext(output_file)[0]
     meta_file = f"{base}.meta"
 
@@ -184,6 +232,369 @@ def extract_and_save(
     return output_file
 
 
+def _advise_sequential(fd: int) -> None:
+    """Ask the kernel for aggressive readahead on a file read front to back.
+
+    Lets disk reads overlap with parsing; a no-op where posix_fadvise is
+    unavailable.
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def _extract_multiple_columns_csv(
+    filename: str,
+    column_indices: List[int]
+) -> Dict[int, TimeSeriesData]:
+    """Extract columns by scanning every row with csv.reader.
+
+    Slow but layout-agnostic: the timestamp may appear in any column.
+    """
+    # Initialize TimeSeriesData for each column
+    time_series_map = {idx: TimeSeriesData() for idx in column_indices}
+    match = TIMESTAMP_PATTERN.match  # bound once for the per-cell loop
+    # (index, add_point) pairs bound once instead of a dict lookup per cell
+    targets = [(idx, ts.add_point) for idx, ts in time_series_map.items()]
+
+    with open(filename, newline='', encoding='utf-8-sig', buffering=IO_BUFFER_SIZE) as csvfile:
+        _advise_sequential(csvfile.fileno())
+        reader = csv.reader(csvfile)
+
+        for row in reader:
+            # Look for timestamp in any column; csv.reader already removed
+            # the quotes around quoted cells
+            timestamp = None
+            for cell in row:
+                if len(cell) == TIMESTAMP_LENGTH and match(cell):
+                    timestamp = cell
+                    break
+
+            if timestamp:
+                # Extract value from each target column
+                for col_idx, add_point in targets:
+                    try:
+                        value = float(row[col_idx])
+                    except (IndexError, ValueError):
+                        value = None
+                    add_point(timestamp, value)
+
+    return time_series_map
+
+
+# Block size for the pyarrow CSV reader: each streamed record batch covers
+# this much raw CSV, and large blocks keep the conversion threads busy
+ARROW_BLOCK_SIZE = 64 * 1024 * 1024
+
+
+def _extract_multiple_columns_arrow(
+    filename: str,
+    column_indices: List[int]
+) -> Dict[int, TimeSeriesData]:
+    """Extract columns with the multithreaded pyarrow CSV reader.
+
+    Assumes the PDH-CSV layout: a single header row followed by data rows
+    with the timestamp in column 0. Only the timestamp column and the
+    requested columns are converted; indices past the last column yield
+    missing values, matching the csv.reader path.
+
+    Raises:
+        pyarrow.ArrowInvalid: If a row or cell cannot be parsed
+    """
+    value_names = sorted({f"f{idx}" for idx in column_indices} - {"f0"})
+    column_types = {name: pa.float64() for name in value_names}
+    column_types["f0"] = pa.string()
+
+    # Stream record batches so only one block of raw CSV is held at a time
+    reader = pacsv.open_csv(
+        filename,
+        read_options=pacsv.ReadOptions(
+            use_threads=True,
+            block_size=ARROW_BLOCK_SIZE,
+            skip_rows=1,
+            autogenerate_column_names=True,
+        ),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=["f0"] + value_names,
+            include_missing_columns=True,
+            column_types=column_types,
+            null_values=[""],
+            strings_can_be_null=False,
+        ),
+    )
+
+    time_series_map = {idx: TimeSeriesData() for idx in column_indices}
+    for batch in reader:
+        _time_series_from_table(
+            pa.Table.from_batches([batch]), column_indices, time_series_map
+        )
+    return time_series_map
+
+
+def _time_series_from_table(
+    table,
+    column_indices: List[int],
+    time_series_map: Optional[Dict[int, TimeSeriesData]] = None
+) -> Dict[int, TimeSeriesData]:
+    """Build TimeSeriesData from an Arrow table with columns named f{index}.
+
+    Rows whose f0 is not a timestamp are dropped. Requested columns that are
+    absent or not numeric (e.g. f0 itself) yield missing values. If
+    time_series_map is given, points are appended to it instead.
+    """
+    if time_series_map is None:
+        time_series_map = {idx: TimeSeriesData() for idx in column_indices}
+
+    # Drop any row whose first cell is not a timestamp
+    is_timestamp = pc.match_substring_regex(
+        table.column("f0"), f"^{_TIMESTAMP_REGEX}$"
+    )
+    table = table.filter(is_timestamp)
+    timestamps = table.column("f0").to_pylist()
+
+    for col_idx in dict.fromkeys(column_indices):
+        name = f"f{col_idx}"
+        if name in table.column_names and pa.types.is_floating(table.schema.field(name).type):
+            values = table.column(name).to_pylist()
+        else:
+            values = [None] * len(timestamps)
+
+        time_series_map[col_idx].add_points(timestamps, values)
+
+    return time_series_map
+
+
+_NEWLINE = ord('\n')
+_COMMA = ord(',')
+_QUOTE = ord('"')
+_CR = ord('\r')
+
+# Byte offsets of the digits and separators in MM/DD/YYYY HH:MM:SS
+_TS_DIGIT_OFFSETS = np.array([0, 1, 3, 4, 6, 7, 8, 9, 11, 12, 14, 15, 17, 18])
+_TS_SEP_OFFSETS = np.array([2, 5, 10, 13, 16])
+_TS_SEPARATORS = np.frombuffer(b'// ::', dtype=np.uint8)
+
+
+def _find_timestamp_lines(
+    buf: np.ndarray,
+    line_starts: np.ndarray,
+    line_ends: np.ndarray
+) -> Tuple[np.ndarray, List[str]]:
+    """Find lines whose first field is a (optionally quoted) timestamp.
+
+    Checks the fixed MM/DD/YYYY HH:MM:SS byte layout for all lines at once
+    instead of decoding and regex-matching each line's first field.
+
+    Returns:
+        Boolean mask over the lines, and the timestamps of matching lines
+    """
+    quoted = buf[line_starts] == _QUOTE
+    ts_starts = line_starts + quoted
+    field_ends = ts_starts + 19 + quoted  # one past the closing quote, if any
+    ok = field_ends <= line_ends
+    ts_starts = np.where(ok, ts_starts, 0)
+    field_ends = np.where(ok, field_ends, 0)
+
+    # Clamp so files shorter than a timestamp stay in bounds; those lines
+    # are already marked not ok
+    chars = buf[np.minimum(ts_starts[:, None] + np.arange(19), len(buf) - 1)]
+    digits = chars[:, _TS_DIGIT_OFFSETS]
+    ok &= ((digits >= ord('0')) & (digits <= ord('9'))).all(axis=1)
+    ok &= (chars[:, _TS_SEP_OFFSETS] == _TS_SEPARATORS).all(axis=1)
+    ok &= ~quoted | (buf[np.maximum(field_ends - 1, 0)] == _QUOTE)
+
+    # The field must end right there: at a comma, a CR before the newline,
+    # or the end of the line
+    after = buf[np.minimum(field_ends, len(buf) - 1)]
+    ok &= (
+        (field_ends == line_ends)
+        | (after == _COMMA)
+        | ((after == _CR) & (field_ends + 1 == line_ends))
+    )
+
+    timestamps = chars[ok].view('S19').ravel().astype('U19').tolist()
+    return ok, timestamps
+
+
+# Bytes of the file the mmap path scans per block (extended to the next newline)
+MMAP_BLOCK_SIZE = 8 * 1024 * 1024
+
+
+def _extract_multiple_columns_mmap(
+    filename: str,
+    column_indices: List[int]
+) -> Dict[int, TimeSeriesData]:
+    """Extract columns from a memory-mapped PDH-CSV file.
+
+    The file is processed in blocks of whole lines, cut at the first newline
+    after every MMAP_BLOCK_SIZE bytes. Within a block, newlines, timestamp
+    rows and commas are found with vectorized numpy scans, and the bounds of
+    each requested field in every row are looked up with searchsorted, so
+    only the requested cells are sliced out and converted. Data rows are
+    assumed to have the timestamp in column 0 and no commas inside quoted
+    fields, which holds for esxtop exports.
+    """
+    time_series_map = {idx: TimeSeriesData() for idx in column_indices}
+    if os.path.getsize(filename) == 0:
+        return time_series_map
+
+    with open(filename, 'rb') as f:
+        _advise_sequential(f.fileno())
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    buf = None
+    try:
+        if hasattr(mapped, "madvise"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        buf = np.frombuffer(mapped, dtype=np.uint8)
+
+        pos = 0
+        while pos < len(buf):
+            cut = mapped.find(b'\n', pos + MMAP_BLOCK_SIZE - 1)
+            block_end = len(buf) if cut == -1 else cut + 1
+            _extract_mmap_block(
+                mapped, buf, pos, block_end, column_indices, time_series_map
+            )
+            pos = block_end
+    finally:
+        # Drop the buffer export so the map can be unmapped right away
+        buf = None
+        try:
+            mapped.close()
+        except BufferError:
+            pass  # A traceback still holds a view; unmapped when it is freed
+
+    return time_series_map
+
+
+# Widest cell _convert_fields converts as a fixed-width numpy byte array
+_MAX_BULK_FIELD_WIDTH = 64
+
+
+def _convert_fields(
+    mapped: mmap.mmap,
+    buf: np.ndarray,
+    field_starts: np.ndarray,
+    field_ends: np.ndarray,
+    present: np.ndarray
+) -> List[Optional[float]]:
+    """Convert the cells buf[field_starts:field_ends] to floats in bulk.
+
+    Surrounding quotes and a trailing CR are trimmed, the cells are gathered
+    into one NUL-padded fixed-width byte array and converted with a single
+    astype(). Missing or empty cells become None. If any other cell is not
+    a number, or cells are unusually wide, each cell is converted separately.
+    """
+    # Point absent fields at an empty range so every lookup stays in bounds
+    field_starts = np.where(present, field_starts, 0)
+    field_ends = np.where(present, field_ends, 0)
+    last = np.maximum(field_ends - 1, 0)
+    field_ends = field_ends - ((field_ends > field_starts) & (buf[last] == _CR))
+    quoted = (field_ends > field_starts) & (buf[field_starts] == _QUOTE)
+    field_starts = field_starts + quoted
+    last = np.maximum(field_ends - 1, 0)
+    field_ends = np.maximum(field_ends - (quoted & (buf[last] == _QUOTE)), field_starts)
+    widths = np.where(present, field_ends - field_starts, 0)
+    valid = widths > 0
+
+    width = int(widths.max()) if len(widths) else 0
+    if 0 < width <= _MAX_BULK_FIELD_WIDTH:
+        offsets = np.arange(width)
+        chars = buf[np.minimum(field_starts[:, None] + offsets, len(buf) - 1)]
+        chars[offsets >= widths[:, None]] = 0
+        # Empty and missing cells would make astype() reject the whole
+        # block; give them a placeholder, reset to None below
+        chars[~valid, 0] = ord('0')
+        try:
+            converted = chars.view(f'S{width}').ravel().astype(np.float64)
+        except ValueError:
+            pass  # Some cell is not a number; convert one by one below
+        else:
+            values = converted.tolist()
+            for i in np.flatnonzero(~valid).tolist():
+                values[i] = None
+            return values
+
+    values = []
+    for ok, field_start, field_end in zip(
+        valid.tolist(), field_starts.tolist(), field_ends.tolist()
+    ):
+        if not ok:
+            values.append(None)
+            continue
+        try:
+            values.append(float(mapped[field_start:field_end].strip(b'"\r')))
+        except ValueError:
+            values.append(None)
+    return values
+
+
+def _extract_mmap_block(
+    mapped: mmap.mmap,
+    buf: np.ndarray,
+    block_start: int,
+    block_end: int,
+    column_indices: List[int],
+    time_series_map: Dict[int, TimeSeriesData]
+) -> None:
+    """Append the requested fields of the whole lines in buf[block_start:block_end]."""
+    line_ends = np.flatnonzero(buf[block_start:block_end] == _NEWLINE) + block_start
+    if not len(line_ends) or line_ends[-1] != block_end - 1:
+        line_ends = np.append(line_ends, block_end)  # last line has no newline
+    line_starts = np.concatenate(([block_start], line_ends[:-1] + 1))
+
+    is_data, timestamps = _find_timestamp_lines(buf, line_starts, line_ends)
+    if not timestamps:
+        return
+    starts = line_starts[is_data]
+    ends = line_ends[is_data]
+
+    # Comma positions in the data rows, plus a sentinel so lookups stay in range
+    span_start, span_end = int(starts[0]), int(ends[-1])
+    commas = np.flatnonzero(buf[span_start:span_end] == _COMMA) + span_start
+    commas = np.append(commas, span_end)
+    first_comma = np.searchsorted(commas, starts)
+    n_commas = np.searchsorted(commas, ends) - first_comma
+
+    for col_idx in time_series_map:
+        # Field k of a row lies between its (k-1)th and kth comma
+        present = n_commas >= col_idx
+        if col_idx == 0:
+            field_starts = starts
+        else:
+            prev = np.minimum(first_comma + col_idx - 1, len(commas) - 1)
+            field_starts = commas[prev] + 1
+        field_ends = np.where(
+            n_commas > col_idx,
+            commas[np.minimum(first_comma + col_idx, len(commas) - 1)],
+            ends,
+        )
+
+        values = _convert_fields(mapped, buf, field_starts, field_ends, present)
+        time_series_map[col_idx].add_points(timestamps, values)
+
+
+def _collapse_repeated_timestamps(
+    time_series_map: Dict[int, TimeSeriesData]
+) -> Dict[int, TimeSeriesData]:
+    """Keep one point per timestamp: its first position and its last value.
+
+    Every backend adds the same timestamps to all requested columns, so
+    checking one series decides for all of them; files without repeated
+    timestamps are returned as they are.
+    """
+    first = next(iter(time_series_map.values()), None)
+    if first is None or len(set(first.timestamps)) == len(first):
+        return time_series_map
+
+    collapsed = {}
+    for col_idx, time_series in time_series_map.items():
+        collapsed[col_idx] = TimeSeriesData(dedupe=True)
+        collapsed[col_idx].add_points(time_series.timestamps, time_series.values)
+    return collapsed
+
+
 def extract_multiple_columns(
     filename: str,
     column_indices: List[int]
@@ -191,7 +602,15 @@ def extract_multiple_columns(
     """Extract time series data from multiple CSV columns in a single pass.
 
     This is much more efficient than calling extract_column_data multiple times
-    for large files, as it only reads the CSV file once.
+    for large files, as it only reads the CSV file once. When pyarrow is
+    installed, the file is parsed by its multithreaded columnar reader;
+    otherwise rows of the memory-mapped file are
+    scanned with numpy. All of these only convert the requested columns and
+    only look for the timestamp in column 0. Files that do not follow the
+    PDH-CSV layout, negative column indices, or any file if STRICT_PDH_LAYOUT
+    is False, fall back to scanning every cell with csv.reader. A timestamp
+    that appears in several rows yields one point, holding the value from
+    the last of them.
 
     Args:
         filename: Path to CSV file
@@ -210,32 +629,27 @@ def extract_multiple_columns(
         >>> for col_idx, data in results.items():
         ...     print(f"Column {col_idx}: {len(data)} points")
     """
-    # Initialize TimeSeriesData for each column
-    time_series_map = {idx: TimeSeriesData() for idx in column_indices}
+    fast_paths = []
+    # Negative indices count from the end of each row, which only the
+    # csv.reader scan supports
+    if STRICT_PDH_LAYOUT and all(idx >= 0 for idx in column_indices):
+        fast_paths.append(_extract_multiple_columns_mmap)
+        if pa is not None:
+            fast_paths.insert(0, _extract_multiple_columns_arrow)
 
     try:
-        with open(filename, newline='', encoding='utf-8-sig') as csvfile:
-            reader = csv.reader(csvfile)
-
-            for row in reader:
-                # Look for timestamp in any column
-                timestamp = None
-                for cell in row:
-                    cell_clean = cell.strip('"')
-                    if TIMESTAMP_PATTERN.fullmatch(cell_clean):
-                        timestamp = cell_clean
-                        break
-
-                if timestamp:
-                    # Extract value from each target column
-                    for col_idx in column_indices:
-                        try:
-                            value = float(row[col_idx])
-                            time_series_map[col_idx].add_point(timestamp, value)
-                        except (IndexError, ValueError):
-                            time_series_map[col_idx].add_point(timestamp, None)
-
-        return time_series_map
+        for fast_path in fast_paths:
+            try:
+                time_series_map = fast_path(filename, column_indices)
+            except ValueError:
+                continue  # Unparsable row or cell (includes pyarrow.ArrowInvalid)
+            if any(len(ts) for ts in time_series_map.values()):
+                return _collapse_repeated_timestamps(time_series_map)
+
+        # Non-PDH layout: look for the timestamp in every cell
+        return _collapse_repeated_timestamps(
+            _extract_multiple_columns_csv(filename, column_indices)
+        )
 
     except FileNotFoundError:
         raise FileNotFoundError(f"CSV file '{filename}' not found")
@@ -247,7 +661,8 @@ def extract_and_save_batch(
     filename: str,
     column_indices: List[int],
     output_dir: str = ".",
-    column_titles: Optional[Dict[int, str]] = None
+    column_titles: Optional[Dict[int, str]] = None,
+    columns: Optional[List[ColumnMetadata]] = None
 ) -> List[str]:
     """Extract multiple columns and save each to a separate .data file.
 
@@ -260,6 +675,8 @@ def extract_and_save_batch(
         column_indices: List of column indices to extract
         output_dir: Directory to save output files (default: current directory)
         column_titles: Optional dict mapping column index to human-friendly title
+        columns: Optional column metadata already returned by parse_csv_header.
+                 Used to derive titles when column_titles is not given.
 
     Returns:
         List of created output file paths
@@ -274,7 +691,11 @@ def extract_and_save_batch(
         >>> print(f"Created {len(files)} files: {files}")
         Created 2 files: ['col_100.data', 'col_200.data']
     """
-    import os
+    if column_titles is None and columns is not None:
+        wanted = set(column_indices)
+        column_titles = {
+            col.index: col.get_friendly_name() for col in columns if col.index in wanted
+        }
 
     # Extract all columns in one pass
     results = extract_multiple_columns(filename, column_indices)
@@ -291,3 +712,82 @@ def extract_and_save_batch(
             save_metadata(column_titles[col_idx], output_file)
 
     return output_files
+
+
+def extract_and_save_streaming(
+    filename: str,
+    column_indices: List[int],
+    output_dir: str = "."
+) -> List[str]:
+    """Extract columns and write each to col_{index}.data while reading.
+
+    Unlike extract_and_save_batch, points are written as soon as their row
+    is parsed and never collected in TimeSeriesData objects, so memory use
+    stays flat however large the CSV file is. Rows are read with csv.reader,
+    which is slower than the columnar backends used by extract_multiple_columns.
+    Output files are identical to those of extract_and_save_batch, except
+    that rows repeating an earlier timestamp are written as they come
+    instead of being collapsed into one point.
+
+    Args:
+        filename: Path to CSV file
+        column_indices: List of column indices to extract
+        output_dir: Directory to save output files (default: current directory)
+
+    Returns:
+        List of created output file paths
+
+    Raises:
+        FileNotFoundError: If CSV file doesn't exist
+        ValueError: If CSV cannot be parsed
+
+    Example:
+        >>> files = extract_and_save_streaming("esxtop_batch.csv", [100, 200])
+        >>> print(files)
+        ['./col_100.data', './col_200.data']
+    """
+    column_indices = list(dict.fromkeys(column_indices))
+    output_files = [os.path.join(output_dir, f"col_{idx}.data") for idx in column_indices]
+    match = TIMESTAMP_PATTERN.match
+
+    def is_timestamp(cell: str) -> bool:
+        return len(cell) == TIMESTAMP_LENGTH and match(cell) is not None
+
+    try:
+        # Like extract_multiple_columns: column 0 first, every cell as fallback
+        for any_column in ((False, True) if STRICT_PDH_LAYOUT else (True,)):
+            written = 0
+            with ExitStack() as stack:
+                csvfile = stack.enter_context(
+                    open(filename, newline='', encoding='utf-8-sig', buffering=IO_BUFFER_SIZE)
+                )
+                _advise_sequential(csvfile.fileno())
+                targets = [
+                    (idx, stack.enter_context(open(path, 'w', buffering=IO_BUFFER_SIZE)).write)
+                    for idx, path in zip(column_indices, output_files)
+                ]
+
+                for row in csv.reader(csvfile):
+                    if any_column:
+                        timestamp = next((cell for cell in row if is_timestamp(cell)), None)
+                    else:
+                        timestamp = row[0] if row and is_timestamp(row[0]) else None
+                    if timestamp is None:
+                        continue
+
+                    for col_idx, write in targets:
+                        try:
+                            write(f"{timestamp}: {float(row[col_idx])}\n")
+                        except (IndexError, ValueError):
+                            write(f"{timestamp}: NaN\n")
+                    written += 1
+
+            if written:
+                break
+
+        return output_files
+
+    except FileNotFoundError:
+        raise FileNotFoundError(f"CSV file '{filename}' not found")
+    except Exception as e:
+        raise ValueError(f"Error extracting data: {e}")
@@ -6,13 +6,30 @@ headers from VMware ESXi esxtop batch mode exports.
 """
 
 import csv
+import os
 import re
 from dataclasses import dataclass
-from typing import List, Dict, Tuple
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
+from typing import List, Dict, Optional, Tuple
 from collections import Counter
 
 
-@dataclass
+# Read buffer for the CSV header line
+HEADER_BUFFER_SIZE = 1 << 20
+
+# VM:disk part of a "Virtual Disk(VM:scsi0:2)" category
+_VDISK_RE = re.compile(r'Virtual Disk\(([^)]+)\)')
+
+
+@lru_cache(maxsize=256)
+def _compile_ci(pattern: str) -> "re.Pattern":
+    """Compile a case-insensitive regex, caching the result per pattern."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+@dataclass(frozen=True)
 class ColumnMetadata:
     """Represents metadata for a single CSV column.
 
@@ -23,6 +40,10 @@ class ColumnMetadata:
         counter: Performance counter name (e.g., "Average MilliSec/Write")
         original: Original column header string
     """
+    # Declared by hand rather than @dataclass(slots=True) to keep Python 3.8
+    # support; saves a per-instance __dict__ on headers with thousands of columns
+    __slots__ = ('index', 'host', 'category', 'counter', 'original')
+
     index: int
     host: str
     category: str
@@ -32,6 +53,15 @@ class ColumnMetadata:
     def __repr__(self) -> str:
         return f"Column {self.index}: {self.original}"
 
+    # Frozen instances with __slots__ cannot be restored by pickle/copy's
+    # default setattr, so pass the state through object.__setattr__
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
     def matches_pattern(self, pattern: str) -> bool:
         """Check if column matches a regex pattern.
 
@@ -41,7 +71,7 @@ class ColumnMetadata:
         Returns:
             True if the column's original header matches the pattern
         """
-        return bool(re.search(pattern, self.original, re.IGNORECASE))
+        return bool(_compile_ci(pattern).search(self.original))
 
     def get_friendly_name(self) -> str:
         """Generate a human-friendly name for this column.
@@ -59,7 +89,7 @@ class ColumnMetadata:
         # Try to extract VMDK name from Virtual Disk category
         if "Virtual Disk" in self.category:
             # Extract VM:disk from "Virtual Disk(VM:scsi0:2)"
-            match = re.search(r'Virtual Disk\(([^)]+)\)', self.category)
+            match = _VDISK_RE.search(self.category)
             if match:
                 vmdk = match.group(1)
                 return f"{vmdk} - {self.counter}"
@@ -78,6 +108,9 @@ def parse_csv_header(filename: str) -> List[ColumnMetadata]:
     Parses CSV files in PDH-CSV format (Performance Data Helper) which use
     the structure: \\hostname\category\counter
 
+    Results are cached per file, keyed on its path, modification time and
+    size, so repeated calls for an unchanged file skip re-parsing the header.
+
     Args:
         filename: Path to CSV file
 
@@ -93,33 +126,53 @@ def parse_csv_header(filename: str) -> List[ColumnMetadata]:
         >>> print(columns[0])
         Column 0: \\esx01.example.com\Virtual Disk(VM:scsi0:0)\Average MilliSec/Write
     """
-    columns = []
-
     try:
-        with open(filename, newline='', encoding='utf-8-sig') as csvfile:
-            reader = csv.reader(csvfile)
-            header = next(reader)
+        st = os.stat(filename)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"CSV file '{filename}' not found")
 
-            for i, col in enumerate(header):
-                col = col.strip('"')  # Remove quotes
+    # Return a copy so callers can't modify the cached list
+    return list(_parse_csv_header_cached(os.path.realpath(filename), st.st_mtime_ns, st.st_size))
 
-                # Skip PDH-CSV metadata columns like "(PDH-CSV 4.0) (UTC)(0)"
-                if col.startswith("(PDH-CSV"):
-                    continue
 
+@lru_cache(maxsize=8)
+def _parse_csv_header_cached(filename: str, mtime_ns: int, size: int) -> List[ColumnMetadata]:
+    """Parse the header of filename; mtime_ns and size only key the cache."""
+    columns = []
+
+    try:
+        # Only the header line is read, however large the file is; the large
+        # buffer fetches a wide PDH header (often hundreds of KiB) in one read()
+        with open(
+            filename, newline='', encoding='utf-8-sig', buffering=HEADER_BUFFER_SIZE
+        ) as csvfile:
+            header_line = csvfile.readline()
+        if not header_line:
+            raise ValueError("file is empty")
+        header = next(csv.reader([header_line]))
+
+        for i, col in enumerate(header):
+            col = col.strip('"')  # Remove quotes
+
+            # Dispatch on the leading characters so the common counter
+            # column costs one slice compare instead of two startswith calls
+            lead = col[:2]
+            if lead == "\\\\":
                 # Parse format: \\host\category\counter
-                if col.startswith("\\\\"):
-                    parts = col.split("\\")[2:]  # First two elements are empty
-                    if len(parts) >= 2:
-                        host = col.split("\\")[2]
-                        category = parts[1]
-                        counter = "\\".join(parts[2:]) if len(parts) > 2 else ""
-                    else:
-                        host = category = counter = ""
+                parts = col.split("\\")  # First two elements are empty
+                if len(parts) >= 4:
+                    host = parts[2]
+                    category = parts[3]
+                    counter = "\\".join(parts[4:])
                 else:
                     host = category = counter = ""
+            elif lead == "(P" and col.startswith("(PDH-CSV"):
+                # Skip PDH-CSV metadata columns like "(PDH-CSV 4.0) (UTC)(0)"
+                continue
+            else:
+                host = category = counter = ""
 
-                columns.append(ColumnMetadata(i, host, category, counter, col))
+            columns.append(ColumnMetadata(i, host, category, counter, col))
 
         return columns
 
@@ -129,12 +182,19 @@ def parse_csv_header(filename: str) -> List[ColumnMetadata]:
         raise ValueError(f"Error parsing CSV file: {e}")
 
 
-def find_columns_by_pattern(filename: str, pattern: str) -> List[ColumnMetadata]:
+def find_columns_by_pattern(
+    filename: str,
+    pattern: str,
+    columns: Optional[List[ColumnMetadata]] = None
+) -> List[ColumnMetadata]:
     """Find all columns matching a regex pattern.
 
     Args:
         filename: Path to CSV file
         pattern: Regular expression pattern to match against column names
+        columns: Optional column metadata already returned by parse_csv_header.
+                 Pass it to skip re-reading the header when the same file is
+                 also summarized or searched with other patterns.
 
     Returns:
         List of matching ColumnMetadata objects
@@ -147,8 +207,10 @@ def find_columns_by_pattern(filename: str, pattern: str) -> List[ColumnMetadata]
         >>> columns = find_columns_by_pattern("esxtop_batch.csv", r"scsi.*Write")
         >>> print(f"Found {len(columns)} matching columns")
     """
-    columns = parse_csv_header(filename)
-    return [col for col in columns if col.matches_pattern(pattern)]
+    if columns is None:
+        columns = parse_csv_header(filename)
+    search = _compile_ci(pattern).search
+    return [col for col in columns if search(col.original)]
 
 
 def print_column_info(column: ColumnMetadata, verbose: bool = False) -> None:
@@ -173,45 +235,62 @@ def print_column_info(column: ColumnMetadata, verbose: bool = False) -> None:
 def summarize_columns(
     filename: str,
     category_pattern: str = None,
-    counter_pattern: str = None
-) -> Tuple[Dict[str, int], Dict[str, int], Dict[Tuple[str, str], int]]:
+    counter_pattern: str = None,
+    columns: Optional[List[ColumnMetadata]] = None
+) -> Tuple[Counter, Counter, Counter]:
     """Summarize categories and counters in CSV file with counts.
 
     Args:
         filename: Path to CSV file
         category_pattern: Optional regex to filter categories
         counter_pattern: Optional regex to filter counters
+        columns: Optional column metadata already returned by parse_csv_header,
+                 used instead of parsing the header again
 
     Returns:
-        Tuple of (category_counts, counter_counts, combined_counts)
-        - category_counts: Dict mapping category to count
-        - counter_counts: Dict mapping counter to count
-        - combined_counts: Dict mapping (category, counter) tuple to count
+        Tuple of (category_counts, counter_counts, combined_counts) as Counters
+        - category_counts: Counter mapping category to count
+        - counter_counts: Counter mapping counter to count
+        - combined_counts: Counter mapping (category, counter) tuple to count
 
     Example:
         >>> cats, counters, combined = summarize_columns("esxtop.csv")
         >>> print(f"Virtual Disk columns: {cats.get('Virtual Disk', 0)}")
         >>> print(f"Write latency metrics: {counters.get('Average MilliSec/Write', 0)}")
     """
-    columns = parse_csv_header(filename)
-
-    # Apply filters if provided
-    if category_pattern or counter_pattern:
-        filtered_columns = []
-        for col in columns:
-            if category_pattern and not re.search(category_pattern, col.category, re.IGNORECASE):
-                continue
-            if counter_pattern and not re.search(counter_pattern, col.counter, re.IGNORECASE):
-                continue
-            filtered_columns.append(col)
-        columns = filtered_columns
-
-    # Count occurrences
-    categories = Counter(col.category for col in columns if col.category)
-    counters = Counter(col.counter for col in columns if col.counter)
-    combined = Counter((col.category, col.counter) for col in columns if col.category and col.counter)
-
-    return dict(categories), dict(counters), dict(combined)
+    if columns is None:
+        columns = parse_csv_header(filename)
+
+    # Compile each filter pattern once
+    category_search = _compile_ci(category_pattern).search if category_pattern else None
+    counter_search = _compile_ci(counter_pattern).search if counter_pattern else None
+
+    # Filter and count in a single pass over the columns
+    categories, counters, combined = Counter(), Counter(), Counter()
+    for col in columns:
+        category, counter = col.category, col.counter
+        if category_search and not category_search(category):
+            continue
+        if counter_search and not counter_search(counter):
+            continue
+        if category:
+            categories[category] += 1
+        if counter:
+            counters[counter] += 1
+            if category:
+                combined[(category, counter)] += 1
+
+    return categories, counters, combined
+
+
+def _top_items(counts: Dict, n: int) -> List[Tuple]:
+    """Return the n highest-count items, ties kept in insertion order.
+
+    heapq.nlargest keeps only n candidates instead of sorting every item.
+    """
+    if isinstance(counts, Counter):
+        return counts.most_common(n)
+    return nlargest(n, counts.items(), key=itemgetter(1))
 
 
 def print_summary(
@@ -235,22 +314,19 @@ def print_summary(
     # Print top categories
     print(f"\n📁 TOP {top_n} CATEGORIES:")
     print("-" * 80)
-    sorted_categories = sorted(category_counts.items(), key=lambda x: x[1], reverse=True)
-    for i, (category, count) in enumerate(sorted_categories[:top_n], 1):
+    for i, (category, count) in enumerate(_top_items(category_counts, top_n), 1):
         print(f"{i:3}. {category:50} [{count:4} columns]")
 
     # Print top counters
     print(f"\n📊 TOP {top_n} COUNTERS:")
     print("-" * 80)
-    sorted_counters = sorted(counter_counts.items(), key=lambda x: x[1], reverse=True)
-    for i, (counter, count) in enumerate(sorted_counters[:top_n], 1):
+    for i, (counter, count) in enumerate(_top_items(counter_counts, top_n), 1):
         print(f"{i:3}. {counter:50} [{count:4} columns]")
 
     # Print top combinations
     print(f"\n🔗 TOP {top_n} CATEGORY + COUNTER COMBINATIONS:")
     print("-" * 80)
-    sorted_combined = sorted(combined_counts.items(), key=lambda x: x[1], reverse=True)
-    for i, ((category, counter), count) in enumerate(sorted_combined[:top_n], 1):
+    for i, ((category, counter), count) in enumerate(_top_items(combined_counts, top_n), 1):
         # Truncate long names for display
         cat_short = category[:35] + "..." if len(category) > 35 else category
         cnt_short = counter[:35] + "..." if len(counter) > 35 else counter
@@ -5,13 +5,36 @@ This module provides utilities to load and plot time series data
 extracted from esxtop batch exports.
 """
 
+import os
 import re
 import sys
+import warnings
 from datetime import datetime
-from typing import List, Tuple, Optional
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Tuple, Optional, Union
 
+import numpy as np
 
-def load_data_file(data_file: str, scale: float = 1.0) -> Tuple[List[datetime], List[float]]:
+# Read buffer for .data files; fewer read() calls on long series
+READ_BUFFER_SIZE = 1 << 20
+
+# Timestamp format written by the extractor
+_DT_FMT = "%m/%d/%Y %H:%M:%S"
+
+# Column number in extractor output names such as col_123.data
+_COL_RE = re.compile(r'col_(\d+)')
+
+# Shortest zero-padded line, "MM/DD/YYYY HH:MM:SS: 0\n"; sizes the
+# preallocation. strptime also accepts unpadded (shorter) lines, which
+# grow the lists past it
+_PADDED_LINE_BYTES = 23
+
+# .meta titles already read, keyed by path: (st_mtime_ns, title)
+_META_CACHE: Dict[str, Tuple[int, str]] = {}
+
+
+def load_data_file(data_file: str, scale: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
     """Load and parse time series data from .data file.
 
     Parses files in "timestamp: value" format and applies optional scaling.
@@ -21,7 +44,8 @@ def load_data_file(data_file: str, scale: float = 1.0) -> Tuple[List[datetime],
         scale: Scaling factor to apply to values (default: 1.0)
 
     Returns:
-        Tuple of (timestamps, values) as lists
+        Tuple of (timestamps, values) as numpy arrays of datetime64[s] and
+        float64, which matplotlib plots without converting
 
     Raises:
         FileNotFoundError: If data file doesn't exist
@@ -31,35 +55,114 @@ def load_data_file(data_file: str, scale: float = 1.0) -> Tuple[List[datetime],
         >>> timestamps, values = load_data_file("col_100.data", scale=100.0)
         >>> print(f"Loaded {len(timestamps)} data points")
     """
-    timestamps = []
-    values = []
+    try:
+        timestamps, values = _load_data_file_numpy(data_file)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Data file '{data_file}' not found")
+    except ValueError:
+        # Malformed lines: parse line by line and skip them
+        timestamps, values = _load_data_file_lines(data_file)
+
+    if len(timestamps) == 0:
+        raise ValueError("No valid data points found in file")
+
+    if scale != 1.0:
+        values *= scale  # one vectorized multiply instead of one per line
+    return timestamps, values
+
+
+def _load_data_file_lines(data_file: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse a .data file line by line, skipping malformed lines.
+
+    The output lists are preallocated from the file size, grown if
+    unpadded timestamps make lines shorter than expected, and trimmed to
+    the parsed count at the end.
+
+    Raises:
+        FileNotFoundError: If data file doesn't exist
+    """
     skipped = 0
+    count = 0
+    strptime = datetime.strptime  # bound once for the per-line loop
 
     try:
-        with open(data_file, 'r') as f:
+        capacity = os.path.getsize(data_file) // _PADDED_LINE_BYTES + 1
+        timestamps = [None] * capacity
+        values = [0.0] * capacity
+
+        with open(data_file, 'r', buffering=READ_BUFFER_SIZE) as f:
             for line in f:
+                # Footers and blank lines have no separator; skip them
+                # without raising. float() ignores the trailing newline.
+                ts, sep, val = line.partition(": ")
+                if not sep:
+                    skipped += 1
+                    continue
                 try:
-                    ts, val = line.strip().split(": ")
-                    dt = datetime.strptime(ts, "%m/%d/%Y %H:%M:%S")
-                    val = float(val) * scale
-                    timestamps.append(dt)
-                    values.append(val)
-                except (ValueError, IndexError):
+                    dt = strptime(ts.lstrip(), _DT_FMT)
+                    val = float(val)
+                except ValueError:
                     skipped += 1
                     continue
+                if count < capacity:
+                    timestamps[count] = dt
+                    values[count] = val
+                else:
+                    timestamps.append(dt)
+                    values.append(val)
+                count += 1
 
         if skipped > 0:
             print(f"Warning: Skipped {skipped} malformed lines", file=sys.stderr)
 
-        if not timestamps:
-            raise ValueError("No valid data points found in file")
-
-        return timestamps, values
+        del timestamps[count:], values[count:]
+        return (np.array(timestamps, dtype='datetime64[s]'),
+                np.array(values, dtype=np.float64))
 
     except FileNotFoundError:
         raise FileNotFoundError(f"Data file '{data_file}' not found")
 
 
+def _load_data_file_numpy(data_file: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse a well-formed .data file with numpy in a few vectorized calls.
+
+    numpy.loadtxt splits each line on spaces into date, time and value in C,
+    and the timestamps are reordered into ISO form as a character array so
+    they convert to datetime64 in one call.
+
+    Raises:
+        ValueError: If any line is malformed
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)  # empty file
+        data = np.loadtxt(
+            data_file,
+            delimiter=' ',
+            # One spare character so overlong fields are caught, not truncated
+            dtype=[('date', 'U11'), ('time', 'U10'), ('value', 'f8')],
+            ndmin=1,
+        )
+
+    date = np.ascontiguousarray(data['date']).view('U1').reshape(-1, 11)
+    time = np.ascontiguousarray(data['time']).view('U1').reshape(-1, 10)
+    well_formed = (
+        (np.char.str_len(data['date']) == 10)
+        & (np.char.str_len(data['time']) == 9)
+        & (date[:, 2] == '/') & (date[:, 5] == '/') & (time[:, 8] == ':')
+    )
+    if not well_formed.all():
+        raise ValueError("Expected 'MM/DD/YYYY HH:MM:SS: value' lines")
+
+    iso = np.empty((len(data), 19), dtype='U1')
+    iso[:, :10] = date[:, [6, 7, 8, 9, 2, 0, 1, 5, 3, 4]]  # YYYY?MM?DD
+    iso[:, [4, 7]] = '-'
+    iso[:, 10] = 'T'
+    iso[:, 11:] = time[:, :8]  # drop trailing ':'
+    timestamps = iso.view('U19').ravel().astype('datetime64[s]')
+
+    return timestamps, np.ascontiguousarray(data['value'])
+
+
 def load_metadata(data_file: str) -> Optional[str]:
     """Load metadata title from companion .meta file if it exists.
 
@@ -74,15 +177,36 @@ def load_metadata(data_file: str) -> Optional[str]:
         >>> print(title)
         'VM:scsi0:2 - Average MilliSec/Write'
     """
-    import os
-    base = os.path.splitext(data_file)[0]
-    meta_file = f"{base}.meta"
+    meta_file = os.path.splitext(data_file)[0] + ".meta"
+
+    # One stat per call; the file is only re-read when it has changed
+    try:
+        mtime_ns = os.stat(meta_file).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    cached = _META_CACHE.get(meta_file)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
 
     try:
         with open(meta_file, 'r') as f:
-            return f.read().strip()
+            title = f.read().strip()
     except FileNotFoundError:
         return None
+    _META_CACHE[meta_file] = (mtime_ns, title)
+    return title
+
+
+@lru_cache(maxsize=1024)
+def _col_num(data_file: str) -> Optional[str]:
+    """Return the column number in a col_N filename, or None.
+
+    Cached because generate_title and generate_output_filename both look
+    it up for the same file.
+    """
+    match = _COL_RE.search(data_file)
+    return match.group(1) if match else None
 
 
 def generate_title(data_file: str, custom_title: Optional[str] = None) -> str:
@@ -113,9 +237,9 @@ def generate_title(data_file: str, custom_title: Optional[str] = None) -> str:
         return metadata_title
 
     # Priority 3: Extract from filename
-    match = re.search(r'col_(\d+)', data_file)
-    if match:
-        return f"Column {match.group(1)} Data Over Time"
+    col_num = _col_num(data_file)
+    if col_num:
+        return f"Column {col_num} Data Over Time"
 
     # Fallback: Use filename
     return f"Data from {data_file}"
@@ -134,29 +258,46 @@ def generate_output_filename(data_file: str) -> str:
         >>> generate_output_filename("col_123.data")
         'esxtop_col_123.png'
     """
-    match = re.search(r'col_(\d+)', data_file)
-    if match:
-        return f"esxtop_col_{match.group(1)}.png"
+    col_num = _col_num(data_file)
+    if col_num:
+        return f"esxtop_col_{col_num}.png"
     return data_file.replace('.data', '.png')
 
 
+def _use_headless_backend() -> None:
+    """Select the Agg backend before pyplot is first imported.
+
+    Saving PNGs never needs a GUI backend, and importing Qt/Tk just to
+    render off-screen costs startup time and memory on every batch run.
+    An explicit MPLBACKEND, or a pyplot that is already loaded, wins.
+    """
+    if "matplotlib.pyplot" in sys.modules or os.environ.get("MPLBACKEND"):
+        return
+    import matplotlib
+    matplotlib.use("Agg")
+
+
 def plot_time_series(
-    timestamps: List[datetime],
-    values: List[float],
+    timestamps: Union[np.ndarray, List[datetime]],
+    values: Union[np.ndarray, List[float]],
     title: str,
     scale: float = 1.0,
     output_file: Optional[str] = None,
-    show: bool = True
+    show: bool = True,
+    ax=None
 ) -> None:
     """Create and display/save a time series chart.
 
     Args:
-        timestamps: List of datetime objects
-        values: List of numeric values
+        timestamps: datetime64 array or list of datetime objects
+        values: Array or list of numeric values
         title: Chart title
         scale: Scale factor (for label display)
         output_file: Optional PNG output file path
         show: Whether to display interactive plot
+        ax: Optional matplotlib Axes to draw on. It is cleared first, so one
+            figure can be reused across a batch of charts instead of
+            creating a new figure per call.
 
     Raises:
         ValueError: If no data to plot
@@ -168,6 +309,8 @@ def plot_time_series(
     """
     # Lazy import matplotlib only when plotting is needed
     try:
+        if not show:
+            _use_headless_backend()
         import matplotlib.pyplot as plt
     except ImportError:
         raise ImportError(
@@ -175,29 +318,37 @@ def plot_time_series(
             "Install it with: pip install matplotlib>=3.7.0"
         )
 
-    if not timestamps:
+    if len(timestamps) == 0:
         raise ValueError("No data to plot")
 
     # Generate appropriate y-axis label based on scale
     label = f"Value × {scale}" if scale != 1.0 else "Value"
     ylabel = label
 
-    plt.figure(figsize=(12, 6))
-    plt.plot(timestamps, values, label=label, color='blue')
-    plt.xlabel("Timestamp")
-    plt.ylabel(ylabel)
-    plt.title(title)
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.grid(True)
-    plt.legend()
+    created = ax is None
+    if created:
+        fig, ax = plt.subplots(figsize=(12, 6))
+    else:
+        fig = ax.figure
+        ax.clear()
+
+    ax.plot(timestamps, values, label=label, color='blue')
+    ax.set_xlabel("Timestamp")
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    ax.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
+    ax.grid(True)
+    ax.legend()
 
     if output_file:
-        plt.savefig(output_file)
+        fig.savefig(output_file)
         print(f"Chart saved as {output_file}")
 
     if show:
         plt.show()
+    elif created:
+        plt.close(fig)  # Don't accumulate open figures across batch calls
 
 
 def visualize(
@@ -205,7 +356,8 @@ def visualize(
     scale: float = 1.0,
     output_file: Optional[str] = None,
     show: bool = True,
-    title: Optional[str] = None
+    title: Optional[str] = None,
+    ax=None
 ) -> None:
     """High-level function to load and visualize a data file.
 
@@ -218,6 +370,7 @@ def visualize(
         output_file: Optional PNG output file path
         show: Whether to display interactive plot (default: True)
         title: Optional custom title (overrides .meta file and filename)
+        ax: Optional matplotlib Axes to reuse (see plot_time_series)
 
     Raises:
         FileNotFoundError: If data file doesn't exist
@@ -231,4 +384,84 @@ def visualize(
     """
     timestamps, values = load_data_file(data_file, scale)
     chart_title = generate_title(data_file, title)
-    plot_time_series(timestamps, values, chart_title, scale, output_file, show)
+    plot_time_series(timestamps, values, chart_title, scale, output_file, show, ax)
+
+
+# Axes every chart in a render worker is drawn on; set by _init_render_worker
+_worker_ax = None
+
+
+def _new_render_axes():
+    """Create an off-screen figure and return its Axes for batch rendering."""
+    _use_headless_backend()
+    import matplotlib.pyplot as plt
+    _, ax = plt.subplots(figsize=(12, 6))
+    return ax
+
+
+def _init_render_worker() -> None:
+    """Process pool initializer: render off-screen on one reused Axes."""
+    global _worker_ax
+    import matplotlib
+    matplotlib.use("Agg")
+    _worker_ax = _new_render_axes()
+
+
+def _render_png(job: Tuple[str, float, str]) -> str:
+    """Render one (data_file, scale, output_file) job and return the PNG path."""
+    data_file, scale, output_file = job
+    visualize(data_file, scale, output_file, show=False, ax=_worker_ax)
+    return output_file
+
+
+def visualize_many(
+    data_files: Iterable[str],
+    scale: float = 1.0,
+    output_dir: str = ".",
+    workers: Optional[int] = None
+) -> List[str]:
+    """Render many .data files to PNG charts in parallel.
+
+    Each file becomes one chart named by generate_output_filename inside
+    output_dir. Charts are independent, so they are spread over worker
+    processes; threads would not help since rendering holds the GIL. Each
+    worker draws all of its charts on one reused figure.
+
+    Args:
+        data_files: Paths to .data files
+        scale: Scaling factor applied to every file (default: 1.0)
+        output_dir: Directory for the PNG files (default: current directory)
+        workers: Number of worker processes (default: os.cpu_count())
+
+    Returns:
+        List of PNG paths, in the same order as data_files
+
+    Raises:
+        FileNotFoundError: If a data file doesn't exist
+        ValueError: If a data file has no valid data
+
+    Example:
+        >>> visualize_many(glob.glob("col_*.data"), output_dir="charts")
+        ['charts/esxtop_col_100.png', 'charts/esxtop_col_101.png']
+    """
+    jobs = [
+        (data_file, scale,
+         os.path.join(output_dir, generate_output_filename(os.path.basename(data_file))))
+        for data_file in data_files
+    ]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+
+    # Not worth starting a pool for a single worker
+    if workers <= 1:
+        ax = _new_render_axes()
+        try:
+            for data_file, job_scale, output_file in jobs:
+                visualize(data_file, job_scale, output_file, show=False, ax=ax)
+        finally:
+            import matplotlib.pyplot as plt
+            plt.close(ax.figure)
+        return [output_file for _, _, output_file in jobs]
+
+    chunksize = max(1, len(jobs) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker) as pool:
+        return list(pool.map(_render_png, jobs, chunksize=chunksize))
@@ -15,7 +15,28 @@ from esxtop_visualizer.extractor import (
     extract_column_data,
     save_time_series,
     extract_and_save,
+    extract_multiple_columns,
+    extract_and_save_batch,
+    extract_and_save_streaming,
 )
+from esxtop_visualizer.parser import parse_csv_header
+from esxtop_visualizer import extractor
+
+
+SAMPLE_CSV = (
+    '"(PDH-CSV 4.0) (UTC)(0)","\\\\esx01\\Virtual Disk(VM1:scsi0:0)\\Average MilliSec/Write",'
+    '"\\\\esx01\\Virtual Disk(VM1:scsi0:1)\\Average MilliSec/Write"\n'
+    '"01/01/2024 12:00:00","1.5","2.0"\n'
+    '"01/01/2024 12:00:05","","3.25"\n'
+    '"01/01/2024 12:00:10","4","5"\n'
+)
+
+
+@pytest.fixture
+def sample_csv(tmp_path):
+    path = tmp_path / "esxtop_batch.csv"
+    path.write_text(SAMPLE_CSV)
+    return str(path)
 
 
 def test_time_series_data_creation():
@@ -54,13 +75,167 @@ def test_time_series_data_with_none_values():
     assert data_points[1][1] is None
 
 
+def test_time_series_data_dedupe():
+    """Test dedupe=True keeps one point per timestamp, last value wins."""
+    ts = TimeSeriesData(dedupe=True)
+    ts.add_point("01/01/2024 12:00:00", 1.0)
+    ts.add_point("01/01/2024 12:00:05", 2.0)
+    ts.add_points(["01/01/2024 12:00:00"], [3.0])
+
+    assert list(ts) == [("01/01/2024 12:00:00", 3.0), ("01/01/2024 12:00:05", 2.0)]
+    assert ts.data == {"01/01/2024 12:00:00": 3.0, "01/01/2024 12:00:05": 2.0}
+
+
+def test_time_series_data_data_is_read_only():
+    """Test the data mapping cannot be mutated in place by mistake."""
+    ts = TimeSeriesData()
+    ts.add_point("01/01/2024 12:00:00", 1.0)
+
+    with pytest.raises(TypeError):
+        ts.data["01/01/2024 12:00:05"] = 2.0
+
+
+def test_extract_multiple_columns_collapses_repeated_timestamps(tmp_path):
+    """Test a repeated timestamp keeps its first position and last value."""
+    path = tmp_path / "dup.csv"
+    path.write_text(
+        '"(PDH-CSV 4.0)","a"\n'
+        '"01/01/2024 12:00:00","1"\n'
+        '"01/01/2024 12:00:05","2"\n'
+        '"01/01/2024 12:00:00","3"\n'
+    )
+
+    results = extract_multiple_columns(str(path), [1])
+
+    assert list(results[1]) == [("01/01/2024 12:00:00", 3.0), ("01/01/2024 12:00:05", 2.0)]
+
+
 def test_extract_column_data_file_not_found():
     """Test that extract_column_data raises FileNotFoundError for missing files."""
     with pytest.raises(FileNotFoundError):
         extract_column_data("nonexistent_file.csv", 0)
 
 
+def test_extract_multiple_columns_with_sample_csv(sample_csv):
+    """Test single-pass extraction of several columns, including out-of-range ones."""
+    results = extract_multiple_columns(sample_csv, [1, 2, 99])
+
+    assert list(results[1]) == [
+        ("01/01/2024 12:00:00", 1.5),
+        ("01/01/2024 12:00:05", None),
+        ("01/01/2024 12:00:10", 4.0),
+    ]
+    assert [value for _, value in results[2]] == [2.0, 3.25, 5.0]
+    assert [value for _, value in results[99]] == [None, None, None]
+
+
+def test_extract_multiple_columns_arrow_matches_csv(sample_csv):
+    """Test the pyarrow fast path produces the same data as the csv.reader scan."""
+    pytest.importorskip("pyarrow")
+    indices = [0, 1, 2, 99]
+    arrow_results = extractor._extract_multiple_columns_arrow(sample_csv, indices)
+    csv_results = extractor._extract_multiple_columns_csv(sample_csv, indices)
+
+    for idx in indices:
+        assert list(arrow_results[idx]) == list(csv_results[idx])
+
+
+def test_extract_multiple_columns_mmap_matches_csv(sample_csv):
+    """Test the memory-mapped numpy scan produces the same data as csv.reader."""
+    indices = [0, 1, 2, 99]
+    mmap_results = extractor._extract_multiple_columns_mmap(sample_csv, indices)
+    csv_results = extractor._extract_multiple_columns_csv(sample_csv, indices)
+
+    for idx in indices:
+        assert list(mmap_results[idx]) == list(csv_results[idx])
+
+
+@pytest.mark.parametrize("content", ["a,b\n1,2\n", '"t","x"\n'])
+def test_extract_multiple_columns_mmap_short_file(tmp_path, content):
+    """Test files shorter than one timestamp yield empty series."""
+    path = tmp_path / "short.csv"
+    path.write_text(content)
+
+    results = extractor._extract_multiple_columns_mmap(str(path), [1])
+
+    assert len(results[1]) == 0
+
+
+def test_extract_multiple_columns_full_scan_matches(sample_csv, monkeypatch):
+    """Test disabling STRICT_PDH_LAYOUT gives the same result via the full scan."""
+    expected = extract_multiple_columns(sample_csv, [1, 2])
+    monkeypatch.setattr(extractor, "STRICT_PDH_LAYOUT", False)
+
+    results = extract_multiple_columns(sample_csv, [1, 2])
+    for idx in (1, 2):
+        assert list(results[idx]) == list(expected[idx])
+
+
+@pytest.mark.parametrize("backend", ["arrow", "mmap", "csv"])
+def test_extract_multiple_columns_negative_index(sample_csv, monkeypatch, backend):
+    """Test a negative index counts from the end of the row on every backend."""
+    if backend == "arrow":
+        pytest.importorskip("pyarrow")
+    elif backend == "mmap":
+        monkeypatch.setattr(extractor, "pa", None)
+    else:
+        monkeypatch.setattr(extractor, "STRICT_PDH_LAYOUT", False)
+
+    results = extract_multiple_columns(sample_csv, [1, -1])
+
+    assert [value for _, value in results[-1]] == [2.0, 3.25, 5.0]
+    assert [value for _, value in results[1]] == [1.5, None, 4.0]
+
+
+def test_extract_and_save_batch_titles_from_columns(sample_csv, tmp_path):
+    """Test batch extraction derives .meta titles from pre-parsed columns."""
+    columns = parse_csv_header(sample_csv)
+    files = extract_and_save_batch(sample_csv, [2], output_dir=str(tmp_path), columns=columns)
+
+    assert files == [str(tmp_path / "col_2.data")]
+    assert (tmp_path / "col_2.meta").read_text() == "VM1:scsi0:1 - Average MilliSec/Write"
+
+
+def test_extract_column_data_with_sample_csv(sample_csv):
+    """Test single-column extraction on a small PDH-CSV file."""
+    data = extract_column_data(sample_csv, 2)
+
+    assert list(data) == [
+        ("01/01/2024 12:00:00", 2.0),
+        ("01/01/2024 12:00:05", 3.25),
+        ("01/01/2024 12:00:10", 5.0),
+    ]
+
+
+def test_save_time_series_to_file(tmp_path):
+    """Test .data output format, including NaN for missing values."""
+    ts = TimeSeriesData()
+    ts.add_point("01/01/2024 12:00:00", 42.5)
+    ts.add_point("01/01/2024 12:00:05", None)
+    output_file = tmp_path / "col_1.data"
+
+    save_time_series(ts, str(output_file))
+
+    assert output_file.read_text() == (
+        "01/01/2024 12:00:00: 42.5\n"
+        "01/01/2024 12:00:05: NaN\n"
+    )
+
+
+def test_extract_and_save_streaming_matches_batch(sample_csv, tmp_path):
+    """Test streaming extraction writes the same files as batch extraction."""
+    batch_dir = tmp_path / "batch"
+    stream_dir = tmp_path / "stream"
+    batch_dir.mkdir()
+    stream_dir.mkdir()
+
+    batch_files = extract_and_save_batch(sample_csv, [1, 2, 99], output_dir=str(batch_dir))
+    stream_files = extract_and_save_streaming(sample_csv, [1, 2, 99], output_dir=str(stream_dir))
+
+    assert len(stream_files) == 3
+    for batch_file, stream_file in zip(batch_files, stream_files):
+        assert Path(stream_file).read_text() == Path(batch_file).read_text()
+
+
 # TODO: Add tests with actual sample CSV data
-# - test_extract_column_data_with_sample_csv()
-# - test_save_time_series_to_file()
 # - test_extract_and_save_integration()
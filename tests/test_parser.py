@@ -2,6 +2,8 @@
 Tests for esxtop_visualizer.parser module.
 """
 
+import dataclasses
+import pickle
 import pytest
 import sys
 from pathlib import Path
@@ -15,6 +17,7 @@ from esxtop_visualizer.parser import (
     parse_csv_header,
     find_columns_by_pattern,
     print_column_info,
+    summarize_columns,
 )
 
 
@@ -34,6 +37,16 @@ def test_column_metadata_creation():
     assert "Column 0" in str(col)
 
 
+def test_column_metadata_uses_slots():
+    """Test ColumnMetadata instances carry no per-instance __dict__."""
+    col = ColumnMetadata(0, "esx01", "Memory", "Free MBytes", "\\\\esx01\\Memory\\Free MBytes")
+
+    assert not hasattr(col, "__dict__")
+    with pytest.raises(AttributeError):
+        col.extra = "value"
+    assert pickle.loads(pickle.dumps(col)) == col
+
+
 def test_column_metadata_pattern_matching():
     """Test pattern matching on column metadata."""
     col = ColumnMetadata(
@@ -55,7 +68,67 @@ def test_parse_csv_header_file_not_found():
         parse_csv_header("nonexistent_file.csv")
 
 
+HEADER = (
+    '"(PDH-CSV 4.0) (UTC)(0)","\\\\esx01\\Virtual Disk(VM1:scsi0:0)\\Average MilliSec/Write",'
+    '"\\\\esx01\\Virtual Disk(VM1:scsi0:0)\\Average MilliSec/Read"\n'
+)
+
+
+def test_parse_csv_header_with_sample_data(tmp_path):
+    """Test header parsing splits host, category and counter."""
+    path = tmp_path / "esxtop_batch.csv"
+    path.write_text(HEADER)
+
+    columns = parse_csv_header(str(path))
+
+    assert [col.index for col in columns] == [1, 2]
+    assert columns[0].host == "esx01"
+    assert columns[0].category == "Virtual Disk(VM1:scsi0:0)"
+    assert columns[0].counter == "Average MilliSec/Write"
+
+
+def test_parse_csv_header_cache_invalidated_on_change(tmp_path):
+    """Test cached headers are reused until the file changes."""
+    path = tmp_path / "esxtop_batch.csv"
+    path.write_text(HEADER)
+
+    first = parse_csv_header(str(path))
+    second = parse_csv_header(str(path))
+    assert second == first
+    assert second is not first  # callers get their own list
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        second[1].counter = "changed"  # items are shared with the cache
+    second.clear()
+    assert parse_csv_header(str(path)) == first
+
+    path.write_text(HEADER.replace('\n', ',"\\\\esx01\\Memory\\Free MBytes"\n'))
+    assert len(parse_csv_header(str(path))) == 3
+
+
+def test_find_columns_by_pattern_with_sample_data(tmp_path):
+    """Test pattern search is case-insensitive over the raw headers."""
+    path = tmp_path / "esxtop_batch.csv"
+    path.write_text(HEADER)
+
+    matches = find_columns_by_pattern(str(path), r"scsi.*write")
+
+    assert [col.index for col in matches] == [1]
+
+
+def test_preparsed_columns_skip_header_read(tmp_path):
+    """Test pre-parsed columns are used without reading the file again."""
+    path = tmp_path / "esxtop_batch.csv"
+    path.write_text(HEADER)
+    columns = parse_csv_header(str(path))
+    path.unlink()
+
+    matches = find_columns_by_pattern(str(path), r"scsi.*write", columns=columns)
+    categories, _, _ = summarize_columns(str(path), columns=columns)
+
+    assert [col.index for col in matches] == [1]
+    assert categories == {"Virtual Disk(VM1:scsi0:0)": 2}
+
+
 # TODO: Add tests with actual sample CSV data
-# - test_parse_csv_header_with_sample_data()
-# - test_find_columns_by_pattern_with_sample_data()
 # - test_print_column_info_output()
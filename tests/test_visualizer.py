@@ -2,8 +2,11 @@
 Tests for esxtop_visualizer.visualizer module.
 """
 
+import os
+import numpy as np
 import pytest
 import sys
+from datetime import datetime
 from pathlib import Path
 
 # Add src to path for testing
@@ -15,6 +18,7 @@ from esxtop_visualizer.visualizer import (
     generate_title,
     generate_output_filename,
     plot_time_series,
+    visualize_many,
 )
 
 
@@ -25,6 +29,22 @@ def test_generate_title_with_column_pattern():
     assert "Over Time" in title
 
 
+def test_generate_title_from_meta_file(tmp_path):
+    """Test .meta titles are used and picked up again after they change."""
+    data_file = tmp_path / "col_7.data"
+    meta_file = tmp_path / "col_7.meta"
+    meta_file.write_text("VM1:scsi0:0 - Average MilliSec/Write\n")
+
+    assert generate_title(str(data_file)) == "VM1:scsi0:0 - Average MilliSec/Write"
+
+    meta_file.write_text("VM2:scsi0:1 - Average MilliSec/Read\n")
+    os.utime(meta_file, ns=(0, meta_file.stat().st_mtime_ns + 1_000_000_000))
+    assert generate_title(str(data_file)) == "VM2:scsi0:1 - Average MilliSec/Read"
+
+    meta_file.unlink()
+    assert "Column 7" in generate_title(str(data_file))
+
+
 def test_generate_title_without_pattern():
     """Test title generation from filename without col_NNN pattern."""
     title = generate_title("my_data_file.data")
@@ -49,8 +69,87 @@ def test_load_data_file_not_found():
         load_data_file("nonexistent_file.data")
 
 
+SAMPLE_DATA = (
+    "01/01/2024 12:00:00: 1.5\n"
+    "01/01/2024 12:00:05: NaN\n"
+    "01/01/2024 12:00:10: 4.0\n"
+)
+
+
+def test_load_data_file_with_scaling(tmp_path):
+    """Test vectorized loading of a well-formed .data file."""
+    data_file = tmp_path / "col_1.data"
+    data_file.write_text(SAMPLE_DATA)
+
+    timestamps, values = load_data_file(str(data_file), scale=100.0)
+
+    assert timestamps.dtype == np.dtype('datetime64[s]')
+    assert values.dtype == np.float64
+    assert timestamps.tolist() == [
+        datetime(2024, 1, 1, 12, 0, 0),
+        datetime(2024, 1, 1, 12, 0, 5),
+        datetime(2024, 1, 1, 12, 0, 10),
+    ]
+    assert values[0] == 150.0
+    assert values[1] != values[1]  # NaN
+    assert values[2] == 400.0
+
+
+def test_load_data_file_skips_malformed_lines(tmp_path, capsys):
+    """Test malformed lines fall back to line-by-line parsing and are skipped."""
+    data_file = tmp_path / "col_1.data"
+    data_file.write_text(SAMPLE_DATA + "garbage\n13/45/2024 12:00:15: 2.0\n")
+
+    timestamps, values = load_data_file(str(data_file))
+
+    assert len(timestamps) == 3
+    assert "Skipped 2 malformed lines" in capsys.readouterr().err
+
+
+def test_load_data_file_unpadded_timestamps(tmp_path):
+    """Test short unpadded lines load even when they outnumber the estimate."""
+    data_file = tmp_path / "col_1.data"
+    data_file.write_text("".join(f"1/1/2024 1:0:{i}: 5\n" for i in range(10)))
+
+    timestamps, values = load_data_file(str(data_file))
+
+    assert len(timestamps) == 10
+    assert timestamps[9].astype(datetime) == datetime(2024, 1, 1, 1, 0, 9)
+    assert values.tolist() == [5.0] * 10
+
+
+def test_plot_time_series_reuses_axes(tmp_path):
+    """Test charts can be drawn on one reused Axes and saved repeatedly."""
+    plt = pytest.importorskip("matplotlib.pyplot")
+    timestamps = [datetime(2024, 1, 1, 12, 0, 0), datetime(2024, 1, 1, 12, 0, 5)]
+    fig, ax = plt.subplots()
+
+    for name in ("a.png", "b.png"):
+        plot_time_series(timestamps, [1.0, 2.0], name, output_file=str(tmp_path / name),
+                         show=False, ax=ax)
+
+    assert (tmp_path / "a.png").exists()
+    assert (tmp_path / "b.png").exists()
+    assert len(ax.lines) == 1
+    assert ax.get_title() == "b.png"
+    plt.close(fig)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_visualize_many_writes_one_png_per_file(tmp_path, workers):
+    """Test batch rendering serially and with a process pool."""
+    pytest.importorskip("matplotlib")
+    data_files = []
+    for col in (1, 2):
+        data_file = tmp_path / f"col_{col}.data"
+        data_file.write_text(SAMPLE_DATA)
+        data_files.append(str(data_file))
+
+    outputs = visualize_many(data_files, output_dir=str(tmp_path), workers=workers)
+
+    assert outputs == [str(tmp_path / "esxtop_col_1.png"), str(tmp_path / "esxtop_col_2.png")]
+    assert all(os.path.exists(path) for path in outputs)
+
+
 # TODO: Add tests with actual sample data files
-# - test_load_data_file_with_sample_data()
-# - test_load_data_file_with_scaling()
-# - test_plot_time_series_basic()
 # - test_plot_time_series_empty_data()